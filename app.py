@@ -1,95 +1,232 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.units import inch
+import numpy as np
+import importlib.util
+import logging
 from io import BytesIO
 from datetime import datetime
 
+# Optional JIT for the tax kernel, installed with the `jit` extra
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 st.set_page_config(
     page_title="Calculateur d'Impôt Progressif",
     page_icon="💰",
     layout="wide"
 )
 
+_CUSTOM_CSS = """
+<style>
+    .stApp {
+        background: linear-gradient(135deg, #FFE4E1 0%, #FFEFD5 50%, #E0F8F7 100%);
+    }
+    .stTitle {
+        color: #FF6B9D !important;
+        text-align: center;
+        font-size: 3rem !important;
+        text-shadow: 2px 2px 4px rgba(255, 107, 157, 0.3);
+    }
+    .stMarkdown h2, .stMarkdown h3 {
+        color: #FF6B9D !important;
+    }
+    div[data-testid="stMetricValue"] {
+        color: #E65C8F !important;
+        font-weight: 600;
+    }
+    div[data-testid="stMetricLabel"] {
+        color: #2D5A5A !important;
+        font-weight: 500;
+    }
+    .stDataFrame {
+        background-color: rgba(255, 255, 255, 0.9);
+        border-radius: 10px;
+        padding: 10px;
+    }
+</style>
+"""
+
+_SUBTITLE_HTML = "<p style='text-align: center; color: #2D5A5A; font-size: 1.1em;'>✨ Calculez votre impôt en fonction des tranches progressives ✨</p>"
+
+_FOOTER_HTML = """
+    <div style='text-align: center; color: #2D5A5A; font-size: 0.95em; background-color: rgba(255, 255, 255, 0.7); padding: 20px; border-radius: 15px;'>
+    <p><strong>💡 Explication des Tranches d'Impôt:</strong></p>
+    <p>Les taux d'imposition progressifs s'appliquent au revenu dans des plages spécifiques. Vous ne payez le taux plus élevé que sur le revenu au-dessus de chaque seuil.</p>
+    <p style='font-size: 0.9em; margin-top: 10px;'>✨ Fait avec 💖 ✨</p>
+    </div>
+    """
+
+# Upper bound of the open-ended top bracket; finite so bracket bounds stay a homogeneous numeric array
+TOP_BRACKET_MAX = 10**12
+
 TAX_BRACKETS_BY_YEAR = {
     "2025": [
         {"min": 0, "max": 10064, "rate": 0.00},
         {"min": 10064, "max": 25659, "rate": 0.11},
         {"min": 25659, "max": 73369, "rate": 0.30},
         {"min": 73369, "max": 157806, "rate": 0.41},
-        {"min": 157806, "max": float('inf'), "rate": 0.45},
+        {"min": 157806, "max": TOP_BRACKET_MAX, "rate": 0.45},
     ],
     "2024": [
         {"min": 0, "max": 9875, "rate": 0.00},
         {"min": 9875, "max": 25175, "rate": 0.10},
         {"min": 25175, "max": 72000, "rate": 0.28},
         {"min": 72000, "max": 155000, "rate": 0.40},
-        {"min": 155000, "max": float('inf'), "rate": 0.44},
+        {"min": 155000, "max": TOP_BRACKET_MAX, "rate": 0.44},
     ],
     "2023": [
         {"min": 0, "max": 9325, "rate": 0.00},
         {"min": 9325, "max": 24500, "rate": 0.10},
         {"min": 24500, "max": 70500, "rate": 0.27},
         {"min": 70500, "max": 152000, "rate": 0.39},
-        {"min": 152000, "max": float('inf'), "rate": 0.43},
+        {"min": 152000, "max": TOP_BRACKET_MAX, "rate": 0.43},
     ],
     "2022": [
         {"min": 0, "max": 8900, "rate": 0.00},
         {"min": 8900, "max": 23850, "rate": 0.09},
         {"min": 23850, "max": 68500, "rate": 0.26},
         {"min": 68500, "max": 148000, "rate": 0.38},
-        {"min": 148000, "max": float('inf'), "rate": 0.42},
+        {"min": 148000, "max": TOP_BRACKET_MAX, "rate": 0.42},
     ],
 }
 
+def _bracket_array(key):
+    """Gather one bracket field into a NumPy array per year"""
+    return {
+        year: np.array([b[key] for b in brackets], dtype=np.float64)
+        for year, brackets in TAX_BRACKETS_BY_YEAR.items()
+    }
+
+_MINS = _bracket_array("min")
+_MAXES = _bracket_array("max")
+_RATES = _bracket_array("rate")
+_CUM_TAX = {
+    year: np.concatenate(([0.0], np.cumsum((_MAXES[year][:-1] - mins[:-1]) * _RATES[year][:-1])))
+    for year, mins in _MINS.items()
+}
+
+BRACKET_COLORS = ['#FFB6C1', '#FFD700', '#87CEEB', '#98FB98', '#FFA07A']
+
+BRACKET_COLUMNS = ("Tranche", "Taux", "Revenu Imposable", "Montant d'Impôt")
+
+_YEARS = tuple(TAX_BRACKETS_BY_YEAR)
+_MINS_2D = np.stack([_MINS[year] for year in _YEARS])
+_MAXES_2D = np.stack([_MAXES[year] for year in _YEARS])
+_RATES_2D = np.stack([_RATES[year] for year in _YEARS])
+
+_BRACKET_LABELS = {
+    year: [
+        f"{b['min']:,.0f} $ +" if i == len(brackets) - 1 else f"{b['min']:,.0f} $ - {b['max']:,.0f} $"
+        for i, b in enumerate(brackets)
+    ]
+    for year, brackets in TAX_BRACKETS_BY_YEAR.items()
+}
+_RATE_LABELS = {
+    year: [f"{b['rate']*100:.0f}%" for b in brackets]
+    for year, brackets in TAX_BRACKETS_BY_YEAR.items()
+}
+
+def _bracket_year(year):
+    """Return the year whose brackets apply, falling back to 2025"""
+    return year if year in TAX_BRACKETS_BY_YEAR else "2025"
+
+def _tax_kernel_py(income, mins, maxes, rates):
+    """Scalar progressive tax over parallel bracket arrays"""
+    total = 0.0
+    for i in range(len(mins)):
+        if income > mins[i]:
+            total += (min(income, maxes[i]) - mins[i]) * rates[i]
+    return total
+
+@st.cache_resource
+def _compile_tax_kernel():
+    """Compile and warm the tax kernel with numba once per process, or None if numba is missing"""
+    if njit is None:
+        return None
+    kernel = njit(_tax_kernel_py)
+    kernel(0.0, _MINS["2025"], _MAXES["2025"], _RATES["2025"])
+    return kernel
+
+_tax_kernel = _compile_tax_kernel()
+
+def _cumulative_tax(income, year):
+    """Tax from the precomputed cumulative table, without the numba kernel"""
+    mins = _MINS[year]
+    i = np.searchsorted(mins, income, side="left") - 1
+    if i < 0:
+        return 0.0
+    return float(_CUM_TAX[year][i] + (income - mins[i]) * _RATES[year][i])
+
 def calculate_tax(income, year="2025"):
     """Calculate progressive tax based on income brackets for a given year"""
-    brackets = TAX_BRACKETS_BY_YEAR.get(year, TAX_BRACKETS_BY_YEAR["2025"])
+    year = _bracket_year(year)
+
+    if _tax_kernel is not None:
+        return float(_tax_kernel(float(income), _MINS[year], _MAXES[year], _RATES[year]))
 
-    total_tax = 0
-    for i, bracket in enumerate(brackets):
-        if income > bracket["min"]:
-            taxable_in_bracket = min(income, bracket["max"]) - bracket["min"]
-            tax_in_bracket = taxable_in_bracket * bracket["rate"]
-            total_tax += tax_in_bracket
+    return _cumulative_tax(income, year)
 
-    return total_tax
+@st.cache_data(max_entries=512)
+def calculate_tax_all_years(income):
+    """Calculate progressive tax on one income for every year in a single broadcast"""
+    taxable = np.clip(np.minimum(income, _MAXES_2D) - _MINS_2D, 0, None)
+    taxes = (taxable * _RATES_2D).sum(axis=1)
+    return dict(zip(_YEARS, taxes.tolist()))
 
+@st.cache_data(max_entries=512)
 def get_bracket_breakdown(income, year="2025"):
-    """Get detailed breakdown of tax per bracket for a given year"""
-    brackets = TAX_BRACKETS_BY_YEAR.get(year, TAX_BRACKETS_BY_YEAR["2025"])
+    """Get detailed breakdown of tax per bracket for a given year
 
-    breakdown = []
-    for bracket in brackets:
-        if income > bracket["min"]:
-            max_val = bracket["max"] if bracket["max"] != float('inf') else income
-            taxable_in_bracket = min(income, bracket["max"]) - bracket["min"]
-            tax_in_bracket = taxable_in_bracket * bracket["rate"]
-
-            if bracket["max"] == float('inf'):
-                bracket_name = f"{bracket['min']:,.0f} $ +"
-            else:
-                bracket_name = f"{bracket['min']:,.0f} $ - {bracket['max']:,.0f} $"
-
-            breakdown.append({
-                "Tranche": bracket_name,
-                "Taux": f"{bracket['rate']*100:.0f}%",
-                "Revenu Imposable": f"{taxable_in_bracket:,.2f} $",
-                "Montant d'Impôt": f"{tax_in_bracket:,.2f} $",
-                "tax_amount_raw": tax_in_bracket
-            })
+    Returns the per-bracket dicts along with the same data as display rows
+    ordered like BRACKET_COLUMNS, for tables and the PDF report.
+    """
+    year = _bracket_year(year)
+    mins = _MINS[year]
+    bracket_labels = _BRACKET_LABELS[year]
+    rate_labels = _RATE_LABELS[year]
 
-    return breakdown
+    # Number of brackets the income reaches into (strictly above their lower bound)
+    active = int(np.searchsorted(mins, income, side="left"))
+    taxable = np.minimum(income, _MAXES[year][:active]) - mins[:active]
+    taxes = taxable * _RATES[year][:active]
 
-def generate_pdf_report(income, deductions, credits, taxable_income, total_tax, effective_rate, net_income, breakdown):
-    """Generate a PDF tax summary report"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    story = []
+    breakdown = []
+    rows = []
+    for i in range(active):
+        row = (
+            bracket_labels[i],
+            rate_labels[i],
+            f"{taxable[i]:,.2f} $",
+            f"{taxes[i]:,.2f} $",
+        )
+        rows.append(row)
+        breakdown.append({
+            **dict(zip(BRACKET_COLUMNS, row)),
+            "tax_amount_raw": float(taxes[i])
+        })
+
+    return breakdown, tuple(rows)
+
+@st.cache_resource
+def _check_rl_accel():
+    """Warn once per process if reportlab's C accelerator is unavailable"""
+    available = importlib.util.find_spec("_rl_accel") is not None
+    if not available:
+        logging.getLogger(__name__).warning(
+            "rl_accel is not installed; reportlab will use its slower pure-Python fallbacks. "
+            "Install reportlab[accel] to enable the C accelerator."
+        )
+    return available
+
+@st.cache_resource
+def _get_pdf_styles():
+    """Build the report's paragraph and table styles once per process"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
 
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
@@ -101,8 +238,52 @@ def generate_pdf_report(income, deductions, credits, taxable_income, total_tax,
         alignment=1
     )
 
+    summary_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B9D')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFF0F5'), colors.lightgrey]),
+    ])
+
+    bracket_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#87CEEB')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFF0F5'), colors.lightgrey]),
+    ])
+
+    return styles, title_style, summary_table_style, bracket_table_style
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def generate_pdf_report(income, deductions, credits, taxable_income, total_tax, effective_rate, net_income, bracket_rows, generated_at):
+    """Generate a PDF tax summary report"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+    from reportlab.lib.units import inch
+
+    _check_rl_accel()
+    styles, title_style, summary_table_style, bracket_table_style = _get_pdf_styles()
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+
     story.append(Paragraph("Rapport d'Impôt sur le Revenu", title_style))
-    story.append(Paragraph(f"Généré le {datetime.now().strftime('%d/%m/%Y à %H:%M')}", styles['Normal']))
+    story.append(Paragraph(f"Généré le {generated_at}", styles['Normal']))
     story.append(Spacer(1, 0.3*inch))
 
     summary_data = [
@@ -117,19 +298,7 @@ def generate_pdf_report(income, deductions, credits, taxable_income, total_tax,
     ]
 
     summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B9D')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFF0F5'), colors.lightgrey]),
-    ]))
+    summary_table.setStyle(summary_table_style)
 
     story.append(summary_table)
     story.append(Spacer(1, 0.5*inch))
@@ -137,29 +306,10 @@ def generate_pdf_report(income, deductions, credits, taxable_income, total_tax,
     story.append(Paragraph("Détails par Tranche d'Impôt", styles['Heading2']))
     story.append(Spacer(1, 0.2*inch))
 
-    bracket_data = [['Tranche', 'Taux', 'Revenu Imposable', 'Montant d\'Impôt']]
-    for item in breakdown:
-        bracket_data.append([
-            item['Tranche'],
-            item['Taux'],
-            item['Revenu Imposable'],
-            item['Montant d\'Impôt']
-        ])
+    bracket_data = [BRACKET_COLUMNS, *bracket_rows]
 
     bracket_table = Table(bracket_data, colWidths=[1.5*inch, 1*inch, 1.75*inch, 1.75*inch])
-    bracket_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#87CEEB')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFF0F5'), colors.lightgrey]),
-    ]))
+    bracket_table.setStyle(bracket_table_style)
 
     story.append(bracket_table)
     story.append(Spacer(1, 0.5*inch))
@@ -167,41 +317,166 @@ def generate_pdf_report(income, deductions, credits, taxable_income, total_tax,
     story.append(Paragraph("Note: Les taux d'imposition progressifs s'appliquent au revenu dans des plages spécifiques. Vous ne payez le taux plus élevé que sur le revenu au-dessus de chaque seuil.", styles['Italic']))
 
     doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
+
+def build_pie_fig(labels, values):
+    """Build the tax-per-bracket donut chart"""
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=.4,
+        marker=dict(colors=BRACKET_COLORS[:len(labels)]),
+        textposition='auto',
+        textinfo='label+percent',
+        hovertemplate='<b>%{label}</b><br>Impôt: %{value:,.2f} $<br>%{percent}<extra></extra>'
+    )])
 
-st.markdown("""
-<style>
-    .stApp {
-        background: linear-gradient(135deg, #FFE4E1 0%, #FFEFD5 50%, #E0F8F7 100%);
-    }
-    .stTitle {
-        color: #FF6B9D !important;
-        text-align: center;
-        font-size: 3rem !important;
-        text-shadow: 2px 2px 4px rgba(255, 107, 157, 0.3);
-    }
-    .stMarkdown h2, .stMarkdown h3 {
-        color: #FF6B9D !important;
-    }
-    div[data-testid="stMetricValue"] {
-        color: #E65C8F !important;
-        font-weight: 600;
-    }
-    div[data-testid="stMetricLabel"] {
-        color: #2D5A5A !important;
-        font-weight: 500;
-    }
-    .stDataFrame {
-        background-color: rgba(255, 255, 255, 0.9);
-        border-radius: 10px;
-        padding: 10px;
-    }
-</style>
-""", unsafe_allow_html=True)
+    fig.update_layout(
+        showlegend=True,
+        height=400,
+        margin=dict(t=20, b=20, l=20, r=20),
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05,
+            font=dict(color='#2D5A5A')
+        ),
+        paper_bgcolor='rgba(255,255,255,0.3)',
+        plot_bgcolor='rgba(255,255,255,0.3)'
+    )
+
+    return fig
+
+def build_bar_fig(bracket_names, income_in_bracket, colors_bar):
+    """Build the income-per-bracket bar chart"""
+    fig = go.Figure(data=[
+        go.Bar(
+            x=bracket_names,
+            y=income_in_bracket,
+            marker=dict(color=colors_bar),
+            text=[f"{val:,.0f} $" if val > 0 else "" for val in income_in_bracket],
+            textposition='auto',
+            hovertemplate='<b>%{x}</b><br>Revenu dans la tranche: %{y:,.2f} $<extra></extra>'
+        )
+    ])
+
+    fig.update_layout(
+        xaxis_title="Tranche d'Impôt",
+        yaxis_title="Montant du Revenu ($)",
+        height=400,
+        showlegend=False,
+        margin=dict(t=20, b=100, l=20, r=20),
+        xaxis=dict(tickangle=-45, tickfont=dict(color='#2D5A5A')),
+        yaxis=dict(tickfont=dict(color='#2D5A5A')),
+        paper_bgcolor='rgba(255,255,255,0.3)',
+        plot_bgcolor='rgba(255,255,255,0.3)'
+    )
+
+    return fig
+
+def build_comparison_fig(scenario_labels, tax_values, net_values):
+    """Build the grouped tax/net income bar chart for the comparison tab"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Impôt Dû',
+        x=scenario_labels,
+        y=tax_values,
+        marker_color='#FFA07A',
+        text=[f"{val:,.0f} $" for val in tax_values],
+        textposition='auto',
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Revenu Net',
+        x=scenario_labels,
+        y=net_values,
+        marker_color='#98FB98',
+        text=[f"{val:,.0f} $" for val in net_values],
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        barmode='group',
+        xaxis_title="Scénarios",
+        yaxis_title="Montant ($)",
+        height=400,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color='#2D5A5A')
+        ),
+        paper_bgcolor='rgba(255,255,255,0.3)',
+        plot_bgcolor='rgba(255,255,255,0.3)',
+        xaxis=dict(tickfont=dict(color='#2D5A5A')),
+        yaxis=dict(tickfont=dict(color='#2D5A5A'))
+    )
+
+    return fig
+
+def build_hist_fig(hist_income, years, taxes, rates):
+    """Build the tax and effective rate chart across years"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=years,
+        y=taxes,
+        name='Impôt Dû',
+        marker_color='#FFA07A',
+        text=[f"{val:,.0f} $" for val in taxes],
+        textposition='auto',
+        yaxis='y',
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=rates,
+        name='Taux Effectif (%)',
+        marker=dict(color='#FF6B9D', size=10),
+        line=dict(color='#FF6B9D', width=3),
+        mode='lines+markers+text',
+        text=[f"{val:.2f}%" for val in rates],
+        textposition='top center',
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        title=f"Évolution de l'Impôt pour un Revenu de {hist_income:,.0f} $",
+        xaxis=dict(title="Année", tickfont=dict(color='#2D5A5A')),
+        yaxis=dict(
+            title=dict(text="Impôt Dû ($)", font=dict(color='#FFA07A')),
+            tickfont=dict(color='#2D5A5A')
+        ),
+        yaxis2=dict(
+            title=dict(text="Taux Effectif (%)", font=dict(color='#FF6B9D')),
+            tickfont=dict(color='#2D5A5A'),
+            overlaying='y',
+            side='right'
+        ),
+        height=400,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color='#2D5A5A')
+        ),
+        paper_bgcolor='rgba(255,255,255,0.3)',
+        plot_bgcolor='rgba(255,255,255,0.3)'
+    )
+
+    return fig
+
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 st.title("💰 Calculateur d'Impôt Progressif")
-st.markdown("<p style='text-align: center; color: #2D5A5A; font-size: 1.1em;'>✨ Calculez votre impôt en fonction des tranches progressives ✨</p>", unsafe_allow_html=True)
+st.markdown(_SUBTITLE_HTML, unsafe_allow_html=True)
 
 tab1, tab2, tab3 = st.tabs(["📊 Calcul Simple", "⚖️ Mode Comparaison", "📅 Comparaison Historique"])
 
@@ -212,82 +487,85 @@ with tab1:
     with col1:
         st.subheader("📋 Informations sur le Revenu")
 
-        income = st.number_input(
-            "Entrez Votre Revenu Annuel ($)",
-            min_value=0,
-            max_value=10000000,
-            value=50000,
-            step=1000,
-            format="%d"
-        )
-
-        st.markdown("---")
-        st.subheader("🎯 Déductions et Crédits")
-
-        with st.expander("Ajouter des Déductions", expanded=False):
-            deduction_401k = st.number_input(
-                "Cotisations 401(k)/REER ($)",
+        with st.form("tax_inputs"):
+            income = st.number_input(
+                "Entrez Votre Revenu Annuel ($)",
                 min_value=0,
-                max_value=100000,
-                value=0,
-                step=500,
-                help="Cotisations à un régime de retraite"
+                max_value=10000000,
+                value=50000,
+                step=1000,
+                format="%d"
             )
 
-            deduction_medical = st.number_input(
-                "Frais Médicaux ($)",
-                min_value=0,
-                max_value=100000,
-                value=0,
-                step=100,
-                help="Dépenses médicales admissibles"
-            )
+            st.markdown("---")
+            st.subheader("🎯 Déductions et Crédits")
+
+            with st.expander("Ajouter des Déductions", expanded=False):
+                deduction_401k = st.number_input(
+                    "Cotisations 401(k)/REER ($)",
+                    min_value=0,
+                    max_value=100000,
+                    value=0,
+                    step=500,
+                    help="Cotisations à un régime de retraite"
+                )
 
-            deduction_charitable = st.number_input(
-                "Dons de Charité ($)",
-                min_value=0,
-                max_value=100000,
-                value=0,
-                step=100,
-                help="Dons à des organismes de bienfaisance"
-            )
+                deduction_medical = st.number_input(
+                    "Frais Médicaux ($)",
+                    min_value=0,
+                    max_value=100000,
+                    value=0,
+                    step=100,
+                    help="Dépenses médicales admissibles"
+                )
 
-            deduction_mortgage = st.number_input(
-                "Intérêts Hypothécaires ($)",
-                min_value=0,
-                max_value=100000,
-                value=0,
-                step=500,
-                help="Intérêts payés sur prêt hypothécaire"
-            )
+                deduction_charitable = st.number_input(
+                    "Dons de Charité ($)",
+                    min_value=0,
+                    max_value=100000,
+                    value=0,
+                    step=100,
+                    help="Dons à des organismes de bienfaisance"
+                )
 
-        with st.expander("Ajouter des Crédits d'Impôt", expanded=False):
-            credit_child = st.number_input(
-                "Crédit pour Enfants ($)",
-                min_value=0,
-                max_value=50000,
-                value=0,
-                step=500,
-                help="Crédit d'impôt pour enfants à charge"
-            )
+                deduction_mortgage = st.number_input(
+                    "Intérêts Hypothécaires ($)",
+                    min_value=0,
+                    max_value=100000,
+                    value=0,
+                    step=500,
+                    help="Intérêts payés sur prêt hypothécaire"
+                )
 
-            credit_education = st.number_input(
-                "Crédit Éducation ($)",
-                min_value=0,
-                max_value=50000,
-                value=0,
-                step=100,
-                help="Crédits pour frais de scolarité"
-            )
+            with st.expander("Ajouter des Crédits d'Impôt", expanded=False):
+                credit_child = st.number_input(
+                    "Crédit pour Enfants ($)",
+                    min_value=0,
+                    max_value=50000,
+                    value=0,
+                    step=500,
+                    help="Crédit d'impôt pour enfants à charge"
+                )
 
-            credit_energy = st.number_input(
-                "Crédit Énergie Verte ($)",
-                min_value=0,
-                max_value=50000,
-                value=0,
-                step=100,
-                help="Crédit pour améliorations écoénergétiques"
-            )
+                credit_education = st.number_input(
+                    "Crédit Éducation ($)",
+                    min_value=0,
+                    max_value=50000,
+                    value=0,
+                    step=100,
+                    help="Crédits pour frais de scolarité"
+                )
+
+                credit_energy = st.number_input(
+                    "Crédit Énergie Verte ($)",
+                    min_value=0,
+                    max_value=50000,
+                    value=0,
+                    step=100,
+                    help="Crédit pour améliorations écoénergétiques"
+                )
+
+            st.form_submit_button("Calculer", use_container_width=True)
 
         total_deductions = deduction_401k + deduction_medical + deduction_charitable + deduction_mortgage
         total_credits = credit_child + credit_education + credit_energy
@@ -296,6 +574,7 @@ with tab1:
 
         if income > 0:
             taxable_income = max(0, income - total_deductions)
+            breakdown, bracket_rows = get_bracket_breakdown(taxable_income)
 
             gross_tax = calculate_tax(taxable_income)
 
@@ -323,78 +602,48 @@ with tab1:
 
             st.markdown("---")
 
-            breakdown = get_bracket_breakdown(taxable_income)
-            pdf_buffer = generate_pdf_report(
-                income,
-                total_deductions,
-                total_credits,
-                taxable_income,
-                total_tax,
-                effective_rate,
-                net_income,
-                breakdown
-            )
+            if st.button("📄 Préparer le Rapport PDF", use_container_width=True):
+                pdf_bytes = generate_pdf_report(
+                    income,
+                    total_deductions,
+                    total_credits,
+                    taxable_income,
+                    total_tax,
+                    effective_rate,
+                    net_income,
+                    bracket_rows,
+                    datetime.now().strftime('%d/%m/%Y à %H:%M')
+                )
 
-            st.download_button(
-                label="📄 Télécharger le Rapport PDF",
-                data=pdf_buffer,
-                file_name=f"rapport_impot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
+                st.download_button(
+                    label="📄 Télécharger le Rapport PDF",
+                    data=pdf_bytes,
+                    file_name=f"rapport_impot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                    mime="application/pdf",
+                    on_click="ignore",
+                    use_container_width=True
+                )
 
     with col2:
         if income > 0:
             st.subheader("🌸 Visualisation des Tranches d'Impôt")
 
-            taxable_income = max(0, income - total_deductions)
-            breakdown = get_bracket_breakdown(taxable_income)
-
             if breakdown:
                 labels = [b["Tranche"] for b in breakdown]
                 values = [b["tax_amount_raw"] for b in breakdown]
 
-                colors = ['#FFB6C1', '#FFD700', '#87CEEB', '#98FB98', '#FFA07A']
-
-                fig = go.Figure(data=[go.Pie(
-                    labels=labels,
-                    values=values,
-                    hole=.4,
-                    marker=dict(colors=colors[:len(labels)]),
-                    textposition='auto',
-                    textinfo='label+percent',
-                    hovertemplate='<b>%{label}</b><br>Impôt: %{value:,.2f} $<br>%{percent}<extra></extra>'
-                )])
-
-                fig.update_layout(
-                    showlegend=True,
-                    height=400,
-                    margin=dict(t=20, b=20, l=20, r=20),
-                    legend=dict(
-                        orientation="v",
-                        yanchor="middle",
-                        y=0.5,
-                        xanchor="left",
-                        x=1.05,
-                        font=dict(color='#2D5A5A')
-                    ),
-                    paper_bgcolor='rgba(255,255,255,0.3)',
-                    plot_bgcolor='rgba(255,255,255,0.3)'
-                )
-
-                st.plotly_chart(fig, use_container_width=True)
+                if sum(values) == 0:
+                    st.info("Aucun impôt dû : votre revenu imposable se situe entièrement dans la tranche à 0 %.")
+                else:
+                    st.plotly_chart(build_pie_fig(tuple(labels), tuple(values)), use_container_width=True)
 
     st.markdown("---")
 
     if income > 0:
         st.subheader("📝 Détails par Tranche")
 
-        taxable_income = max(0, income - total_deductions)
-        breakdown = get_bracket_breakdown(taxable_income)
-
-        if breakdown:
-            df = pd.DataFrame(breakdown)
-            df = df.drop('tax_amount_raw', axis=1)
+        if bracket_rows:
+            df = pd.DataFrame(bracket_rows, columns=BRACKET_COLUMNS)
 
             st.dataframe(
                 df,
@@ -406,62 +655,17 @@ with tab1:
 
             st.subheader("🎨 Répartition du Revenu par Tranche")
 
-            brackets_2025 = TAX_BRACKETS_BY_YEAR["2025"]
-            bracket_ranges = []
-            for bracket in brackets_2025:
-                if bracket["max"] == float('inf'):
-                    bracket_ranges.append({
-                        "name": f"{bracket['min']:,.0f} $ +",
-                        "min": bracket["min"],
-                        "max": max(taxable_income + 1000, bracket["min"] + 10000)
-                    })
-                else:
-                    bracket_ranges.append({
-                        "name": f"{bracket['min']:,.0f} $ - {bracket['max']:,.0f} $",
-                        "min": bracket["min"],
-                        "max": bracket["max"]
-                    })
-
-            bracket_names = []
-            income_in_bracket = []
-            colors_bar = []
-
-            color_palette = ['#FFB6C1', '#FFD700', '#87CEEB', '#98FB98', '#FFA07A']
-
-            for idx, bracket in enumerate(bracket_ranges):
-                bracket_names.append(bracket["name"])
-                if taxable_income > bracket["min"]:
-                    amount = min(taxable_income, bracket["max"]) - bracket["min"]
-                    income_in_bracket.append(amount)
-                    colors_bar.append(color_palette[idx])
-                else:
-                    income_in_bracket.append(0)
-                    colors_bar.append('#F5E6FF')
-
-            fig2 = go.Figure(data=[
-                go.Bar(
-                    x=bracket_names,
-                    y=income_in_bracket,
-                    marker=dict(color=colors_bar),
-                    text=[f"{val:,.0f} $" if val > 0 else "" for val in income_in_bracket],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Revenu dans la tranche: %{y:,.2f} $<extra></extra>'
-                )
-            ])
-
-            fig2.update_layout(
-                xaxis_title="Tranche d'Impôt",
-                yaxis_title="Montant du Revenu ($)",
-                height=400,
-                showlegend=False,
-                margin=dict(t=20, b=100, l=20, r=20),
-                xaxis=dict(tickangle=-45, tickfont=dict(color='#2D5A5A')),
-                yaxis=dict(tickfont=dict(color='#2D5A5A')),
-                paper_bgcolor='rgba(255,255,255,0.3)',
-                plot_bgcolor='rgba(255,255,255,0.3)'
-            )
+            income_in_bracket = np.clip(np.minimum(taxable_income, _MAXES["2025"]) - _MINS["2025"], 0, None)
+            colors_bar = np.where(income_in_bracket > 0, BRACKET_COLORS, "#F5E6FF")
 
-            st.plotly_chart(fig2, use_container_width=True)
+            st.plotly_chart(
+                build_bar_fig(
+                    tuple(_BRACKET_LABELS["2025"]),
+                    tuple(income_in_bracket.tolist()),
+                    tuple(colors_bar.tolist())
+                ),
+                use_container_width=True
+            )
 
 with tab2:
     st.subheader("⚖️ Mode Comparaison")
@@ -475,42 +679,52 @@ with tab2:
 
     st.markdown("---")
 
-    cols = st.columns(num_scenarios)
+    scenario_inputs = []
 
-    scenarios = []
+    with st.form("scenario_inputs"):
+        cols = st.columns(num_scenarios)
 
-    for i, col in enumerate(cols):
-        with col:
-            st.markdown(f"### 📊 Scénario {i+1}")
+        for i, col in enumerate(cols):
+            with col:
+                st.markdown(f"### 📊 Scénario {i+1}")
 
-            scenario_income = st.number_input(
-                f"Revenu Annuel ($)",
-                min_value=0,
-                max_value=10000000,
-                value=30000 + (i * 30000),
-                step=1000,
-                format="%d",
-                key=f"income_{i}"
-            )
+                scenario_income = st.number_input(
+                    f"Revenu Annuel ($)",
+                    min_value=0,
+                    max_value=10000000,
+                    value=30000 + (i * 30000),
+                    step=1000,
+                    format="%d",
+                    key=f"income_{i}"
+                )
 
-            scenario_deductions = st.number_input(
-                f"Déductions Totales ($)",
-                min_value=0,
-                max_value=100000,
-                value=0,
-                step=500,
-                key=f"deductions_{i}"
-            )
+                scenario_deductions = st.number_input(
+                    f"Déductions Totales ($)",
+                    min_value=0,
+                    max_value=100000,
+                    value=0,
+                    step=500,
+                    key=f"deductions_{i}"
+                )
 
-            scenario_credits = st.number_input(
-                f"Crédits d'Impôt ($)",
-                min_value=0,
-                max_value=50000,
-                value=0,
-                step=500,
-                key=f"credits_{i}"
-            )
+                scenario_credits = st.number_input(
+                    f"Crédits d'Impôt ($)",
+                    min_value=0,
+                    max_value=50000,
+                    value=0,
+                    step=500,
+                    key=f"credits_{i}"
+                )
+
+                scenario_inputs.append((scenario_income, scenario_deductions, scenario_credits))
 
+        st.form_submit_button("Comparer", use_container_width=True)
+
+    scenarios_fp = tuple(scenario_inputs)
+    if st.session_state.get("scenarios_fp") != scenarios_fp:
+        scenarios = []
+
+        for scenario_income, scenario_deductions, scenario_credits in scenario_inputs:
             taxable = max(0, scenario_income - scenario_deductions)
             gross_tax = calculate_tax(taxable)
             total_tax = max(0, gross_tax - scenario_credits)
@@ -527,11 +741,16 @@ with tab2:
                 "net_income": net_income
             })
 
-            st.markdown("---")
+        st.session_state["scenarios"] = scenarios
+        st.session_state["scenarios_fp"] = scenarios_fp
 
-            st.metric("Impôt Dû", f"{total_tax:,.2f} $")
-            st.metric("Taux Effectif", f"{effective_rate:.2f}%")
-            st.metric("Revenu Net", f"{net_income:,.2f} $")
+    scenarios = st.session_state["scenarios"]
+
+    for scenario, col in zip(scenarios, st.columns(num_scenarios)):
+        with col:
+            st.metric("Impôt Dû", f"{scenario['tax_owed']:,.2f} $")
+            st.metric("Taux Effectif", f"{scenario['effective_rate']:.2f}%")
+            st.metric("Revenu Net", f"{scenario['net_income']:,.2f} $")
 
     st.markdown("---")
     st.subheader("📊 Tableau Comparatif")
@@ -550,19 +769,26 @@ with tab2:
 
     for i, scenario in enumerate(scenarios):
         comparison_data[f"Scénario {i+1}"] = [
-            f"{scenario['income']:,.2f} $",
-            f"{scenario['deductions']:,.2f} $",
-            f"{scenario['credits']:,.2f} $",
-            f"{scenario['taxable_income']:,.2f} $",
-            f"{scenario['tax_owed']:,.2f} $",
-            f"{scenario['effective_rate']:.2f}%",
-            f"{scenario['net_income']:,.2f} $"
+            scenario['income'],
+            scenario['deductions'],
+            scenario['credits'],
+            scenario['taxable_income'],
+            scenario['tax_owed'],
+            scenario['effective_rate'],
+            scenario['net_income']
         ]
 
     comparison_df = pd.DataFrame(comparison_data)
+    scenario_columns = list(comparison_df.columns[1:])
+    rate_row = comparison_df["Métrique"] == "Taux Effectif"
+    comparison_styler = (
+        comparison_df.style
+        .format("{:,.2f} $", subset=scenario_columns)
+        .format("{:.2f}%", subset=pd.IndexSlice[rate_row, scenario_columns])
+    )
 
     st.dataframe(
-        comparison_df,
+        comparison_styler,
         use_container_width=True,
         hide_index=True
     )
@@ -574,46 +800,13 @@ with tab2:
     tax_values = [s['tax_owed'] for s in scenarios]
     net_values = [s['net_income'] for s in scenarios]
 
-    fig_comparison = go.Figure()
-
-    fig_comparison.add_trace(go.Bar(
-        name='Impôt Dû',
-        x=scenario_labels,
-        y=tax_values,
-        marker_color='#FFA07A',
-        text=[f"{val:,.0f} $" for val in tax_values],
-        textposition='auto',
-    ))
-
-    fig_comparison.add_trace(go.Bar(
-        name='Revenu Net',
-        x=scenario_labels,
-        y=net_values,
-        marker_color='#98FB98',
-        text=[f"{val:,.0f} $" for val in net_values],
-        textposition='auto',
-    ))
-
-    fig_comparison.update_layout(
-        barmode='group',
-        xaxis_title="Scénarios",
-        yaxis_title="Montant ($)",
-        height=400,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color='#2D5A5A')
-        ),
-        paper_bgcolor='rgba(255,255,255,0.3)',
-        plot_bgcolor='rgba(255,255,255,0.3)',
-        xaxis=dict(tickfont=dict(color='#2D5A5A')),
-        yaxis=dict(tickfont=dict(color='#2D5A5A'))
-    )
-
-    st.plotly_chart(fig_comparison, use_container_width=True)
+    if any(tax_values) or any(net_values):
+        st.plotly_chart(
+            build_comparison_fig(tuple(scenario_labels), tuple(tax_values), tuple(net_values)),
+            use_container_width=True
+        )
+    else:
+        st.info("Entrez un revenu dans au moins un scénario pour afficher la comparaison.")
 
 with tab3:
     st.subheader("📅 Comparaison Historique des Tranches d'Impôt")
@@ -640,81 +833,22 @@ with tab3:
             default=["2023", "2024", "2025"]
         )
 
-    with hist_col2:
-        if selected_years and hist_income > 0:
-            year_comparisons = []
-
-            for year in selected_years:
-                tax = calculate_tax(hist_income, year)
-                effective_rate = (tax / hist_income * 100) if hist_income > 0 else 0
-                net_income = hist_income - tax
-
-                year_comparisons.append({
-                    "year": year,
-                    "tax": tax,
-                    "effective_rate": effective_rate,
-                    "net_income": net_income
-                })
-
-            fig_hist = go.Figure()
-
-            years = [y["year"] for y in year_comparisons]
-            taxes = [y["tax"] for y in year_comparisons]
-            rates = [y["effective_rate"] for y in year_comparisons]
+    hist_fp = (hist_income, tuple(selected_years))
+    if st.session_state.get("hist_fp") != hist_fp:
+        all_year_taxes = calculate_tax_all_years(hist_income)
+        year_comparisons = []
 
-            fig_hist.add_trace(go.Bar(
-                x=years,
-                y=taxes,
-                name='Impôt Dû',
-                marker_color='#FFA07A',
-                text=[f"{val:,.0f} $" for val in taxes],
-                textposition='auto',
-                yaxis='y',
-            ))
-
-            fig_hist.add_trace(go.Scatter(
-                x=years,
-                y=rates,
-                name='Taux Effectif (%)',
-                marker=dict(color='#FF6B9D', size=10),
-                line=dict(color='#FF6B9D', width=3),
-                mode='lines+markers+text',
-                text=[f"{val:.2f}%" for val in rates],
-                textposition='top center',
-                yaxis='y2'
-            ))
-
-            fig_hist.update_layout(
-                title=f"Évolution de l'Impôt pour un Revenu de {hist_income:,.0f} $",
-                xaxis=dict(title="Année", tickfont=dict(color='#2D5A5A')),
-                yaxis=dict(
-                    title=dict(text="Impôt Dû ($)", font=dict(color='#FFA07A')),
-                    tickfont=dict(color='#2D5A5A')
-                ),
-                yaxis2=dict(
-                    title=dict(text="Taux Effectif (%)", font=dict(color='#FF6B9D')),
-                    tickfont=dict(color='#2D5A5A'),
-                    overlaying='y',
-                    side='right'
-                ),
-                height=400,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1,
-                    font=dict(color='#2D5A5A')
-                ),
-                paper_bgcolor='rgba(255,255,255,0.3)',
-                plot_bgcolor='rgba(255,255,255,0.3)'
-            )
-
-            st.plotly_chart(fig_hist, use_container_width=True)
+        for year in selected_years:
+            tax = all_year_taxes[year]
+            effective_rate = (tax / hist_income * 100) if hist_income > 0 else 0
+            net_income = hist_income - tax
 
-    if selected_years and hist_income > 0:
-        st.markdown("---")
-        st.subheader("📊 Tableau de Comparaison par Année")
+            year_comparisons.append({
+                "year": year,
+                "tax": tax,
+                "effective_rate": effective_rate,
+                "net_income": net_income
+            })
 
         hist_data = {
             "Année": [],
@@ -724,18 +858,17 @@ with tab3:
             "Différence vs Année Précédente": []
         }
 
-        sorted_years = sorted(selected_years)
         prev_tax = None
 
-        for year in sorted_years:
-            tax = calculate_tax(hist_income, year)
+        for year in sorted(selected_years):
+            tax = all_year_taxes[year]
             effective_rate = (tax / hist_income * 100) if hist_income > 0 else 0
             net_income = hist_income - tax
 
             hist_data["Année"].append(year)
-            hist_data["Impôt Dû"].append(f"{tax:,.2f} $")
-            hist_data["Taux Effectif"].append(f"{effective_rate:.2f}%")
-            hist_data["Revenu Net"].append(f"{net_income:,.2f} $")
+            hist_data["Impôt Dû"].append(tax)
+            hist_data["Taux Effectif"].append(effective_rate)
+            hist_data["Revenu Net"].append(net_income)
 
             if prev_tax is not None:
                 diff = tax - prev_tax
@@ -748,8 +881,40 @@ with tab3:
 
             prev_tax = tax
 
+        st.session_state["year_comparisons"] = year_comparisons
+        st.session_state["hist_data"] = hist_data
+        st.session_state["hist_fp"] = hist_fp
+
+    year_comparisons = st.session_state["year_comparisons"]
+    hist_data = st.session_state["hist_data"]
+
+    with hist_col2:
+        if selected_years and hist_income > 0:
+            years = [y["year"] for y in year_comparisons]
+            taxes = [y["tax"] for y in year_comparisons]
+            rates = [y["effective_rate"] for y in year_comparisons]
+
+            if any(taxes):
+                st.plotly_chart(
+                    build_hist_fig(hist_income, tuple(years), tuple(taxes), tuple(rates)),
+                    use_container_width=True
+                )
+            else:
+                st.info("Aucun impôt dû pour ce revenu dans les années sélectionnées.")
+
+    if selected_years and hist_income > 0:
+        st.markdown("---")
+        st.subheader("📊 Tableau de Comparaison par Année")
+
+        sorted_years = sorted(selected_years)
+
         hist_df = pd.DataFrame(hist_data)
-        st.dataframe(hist_df, use_container_width=True, hide_index=True)
+        hist_styler = hist_df.style.format({
+            "Impôt Dû": "{:,.2f} $",
+            "Taux Effectif": "{:.2f}%",
+            "Revenu Net": "{:,.2f} $"
+        })
+        st.dataframe(hist_styler, use_container_width=True, hide_index=True)
 
         st.markdown("---")
         st.subheader("📋 Détails des Tranches par Année")
@@ -758,20 +923,10 @@ with tab3:
 
         for i, year in enumerate(sorted_years):
             with year_tabs[i]:
-                breakdown = get_bracket_breakdown(hist_income, year)
-                if breakdown:
-                    df_breakdown = pd.DataFrame(breakdown)
-                    df_breakdown = df_breakdown.drop('tax_amount_raw', axis=1)
+                _, year_rows = get_bracket_breakdown(hist_income, year)
+                if year_rows:
+                    df_breakdown = pd.DataFrame(year_rows, columns=BRACKET_COLUMNS)
                     st.dataframe(df_breakdown, use_container_width=True, hide_index=True)
 
 st.markdown("---")
-st.markdown(
-    """
-    <div style='text-align: center; color: #2D5A5A; font-size: 0.95em; background-color: rgba(255, 255, 255, 0.7); padding: 20px; border-radius: 15px;'>
-    <p><strong>💡 Explication des Tranches d'Impôt:</strong></p>
-    <p>Les taux d'imposition progressifs s'appliquent au revenu dans des plages spécifiques. Vous ne payez le taux plus élevé que sur le revenu au-dessus de chaque seuil.</p>
-    <p style='font-size: 0.9em; margin-top: 10px;'>✨ Fait avec 💖 ✨</p>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file
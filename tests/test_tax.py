@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import app
+
+
+def baseline_tax(income, year):
+    """Original bracket-by-bracket loop over the bracket dicts"""
+    brackets = app.TAX_BRACKETS_BY_YEAR.get(year, app.TAX_BRACKETS_BY_YEAR["2025"])
+    total_tax = 0
+    for bracket in brackets:
+        if income > bracket["min"]:
+            total_tax += (min(income, bracket["max"]) - bracket["min"]) * bracket["rate"]
+    return total_tax
+
+
+def _incomes():
+    incomes = {0.0, 1.0, 5_000_000.0, 10_000_000.0}
+    incomes.update(float(i) for i in range(0, 200_000, 37))
+    for brackets in app.TAX_BRACKETS_BY_YEAR.values():
+        for b in brackets[:-1]:
+            for bound in (b["min"], b["max"]):
+                incomes.update((bound - 1.0, float(bound), bound + 1.0))
+    return sorted(i for i in incomes if i >= 0)
+
+
+INCOMES = _incomes()
+
+
+@pytest.mark.parametrize("year", app._YEARS)
+def test_tax_paths_match_baseline(year):
+    expected = np.array([baseline_tax(income, year) for income in INCOMES])
+
+    paths = {
+        "calculate_tax": [app.calculate_tax(income, year) for income in INCOMES],
+        "cumulative": [app._cumulative_tax(income, year) for income in INCOMES],
+        "kernel_py": [
+            app._tax_kernel_py(income, app._MINS[year], app._MAXES[year], app._RATES[year])
+            for income in INCOMES
+        ],
+        "all_years": [app.calculate_tax_all_years(income)[year] for income in INCOMES],
+        "breakdown": [
+            sum(b["tax_amount_raw"] for b in app.get_bracket_breakdown(income, year)[0])
+            for income in INCOMES
+        ],
+    }
+    if app._tax_kernel is not None:
+        paths["kernel"] = [
+            app._tax_kernel(income, app._MINS[year], app._MAXES[year], app._RATES[year])
+            for income in INCOMES
+        ]
+
+    for name, results in paths.items():
+        np.testing.assert_allclose(results, expected, rtol=0, atol=1e-6, err_msg=name)
+
+
+def test_unknown_year_falls_back_to_2025():
+    for income in (0.0, 30_000.0, 200_000.0):
+        assert app.calculate_tax(income, "1999") == pytest.approx(baseline_tax(income, "2025"), abs=1e-6)
+        assert app.get_bracket_breakdown(income, "1999") == app.get_bracket_breakdown(income, "2025")
+
+
+def test_breakdown_rows_match_dicts():
+    breakdown, rows = app.get_bracket_breakdown(120_000.0, "2025")
+    assert len(breakdown) == len(rows) == 4
+    for entry, row in zip(breakdown, rows):
+        assert tuple(entry[col] for col in app.BRACKET_COLUMNS) == row